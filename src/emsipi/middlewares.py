@@ -15,6 +15,18 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(format="[%(levelname)s]: %(message)s", level=logging.INFO)
 
 
+def _clean_starlette_dict(d: Mapping) -> dict:  # type: ignore[type-arg]
+    """Drop the `app` key from a Starlette scope or message.
+
+    Args:
+        d: The Starlette scope or message to clean.
+
+    Returns:
+        A shallow copy of `d` without the `app` key.
+    """
+    return {k: v for k, v in d.items() if k != "app"}
+
+
 class BytesEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle bytes."""
 
@@ -53,33 +65,36 @@ class ASGIMiddleware:
             receive: The ASGI receive function to get messages.
             send: The ASGI send function to send messages.
         """
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        log_enabled = logger.isEnabledFor(logging.INFO)
+
+        # Snapshot the scope before the /mcp rewrite below mutates it.
+        scope_log = _clean_starlette_dict(scope) if log_enabled else None
+
+        if scope.get("path") == "/mcp":
+            scope["path"] = "/mcp/"
+        if scope.get("raw_path") == b"/mcp":
+            scope["raw_path"] = b"/mcp/"
 
-        def clean_starlette_dict(d: Mapping) -> dict:  # type: ignore[type-arg]
-            """Clean the Starlette dictionary by removing empty values."""
-            return {k: v for k, v in d.items() if k not in {"app"}}
+        if not log_enabled:
+            return await self.app(scope, receive, send)
 
         req_log = {
-            "scope": clean_starlette_dict(scope),
+            "scope": scope_log,
             "receive": None,
             "send": None,
         }
 
-        if scope["type"] != "http":
-            return await self.app(scope, receive, send)
-
-        if "path" in scope and scope["path"] == "/mcp":
-            scope["path"] = "/mcp/"
-        if "raw_path" in scope and scope["raw_path"] == b"/mcp":
-            scope["raw_path"] = b"/mcp/"
-
         async def receive_wrapper() -> Message:
             message = await receive()
-            req_log["receive"] = clean_starlette_dict(message)
+            req_log["receive"] = _clean_starlette_dict(message)
             return message
 
         async def send_wrapper(message: Message) -> None:
             # ... Do something
-            req_log["send"] = clean_starlette_dict(message)
+            req_log["send"] = _clean_starlette_dict(message)
             logger.info(json.dumps(req_log, cls=BytesEncoder))
             logger.info(req_log)
             await send(message)
@@ -104,23 +119,24 @@ class SimpleLoggingMiddleware(Middleware):
         Returns:
             The result of the next middleware or handler.
         """
-        logger.info(f"{context}")
-        if context.fastmcp_context is not None:
-            request = cast(
-                "Request", context.fastmcp_context.request_context.request
-            )
-            body = await request.json()
-            headers = request.headers
-            query_params = request.query_params
-            path_params = request.path_params
-            logger.info(
-                {
-                    "body": body,
-                    "headers": headers,
-                    "query_params": query_params,
-                    "path_params": path_params,
-                }
-            )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"{context}")
+            if context.fastmcp_context is not None:
+                request = cast(
+                    "Request", context.fastmcp_context.request_context.request
+                )
+                body = await request.json()
+                headers = request.headers
+                query_params = request.query_params
+                path_params = request.path_params
+                logger.info(
+                    {
+                        "body": body,
+                        "headers": headers,
+                        "query_params": query_params,
+                        "path_params": path_params,
+                    }
+                )
 
         try:
             result = await call_next(context)
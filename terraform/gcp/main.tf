@@ -78,30 +78,50 @@ resource "google_project_iam_member" "run_sa_artifact_reader" {
 ############################################################################
 
 locals {
-  # Hash of the Git index ≈ current commit; adjust path as needed
-  repo_hash = filesha256("${path.root}/../../.git/index")
+  # Root of the emsipi checkout (build context for Cloud Build)
+  repo_root = abspath("${path.root}/../..")
+
+  # Files that determine the image: the Dockerfile, the project metadata
+  # `uv sync` builds from (README.md is the package readme) and the
+  # package source. The rest of the `COPY . /app` context (tests, docs,
+  # terraform, tooling config) doesn't change what the server runs and
+  # is deliberately left out; adjust as needed. `fileset` already returns
+  # paths in lexical order.
+  source_files = concat(
+    ["Dockerfile", "pyproject.toml", "uv.lock", "README.md"],
+    [
+      for f in fileset(local.repo_root, "src/**") : f
+      if !strcontains(f, "__pycache__")
+    ],
+  )
+
+  # Hash of the image inputs (names and contents), stable across commits
+  # that don't touch them
+  source_hash = sha256(join("", [
+    for f in local.source_files : "${f}:${filesha256("${local.repo_root}/${f}")}\n"
+  ]))
 
   # Use the first 12 chars (like a short SHA)
-  tag       = substr(local.repo_hash, 0, 12)
+  tag       = substr(local.source_hash, 0, 12)
 
   image_name = "${var.region}-docker.pkg.dev/${var.project_id}/${var.artifact_repository_id}/${var.service_name}"
   full_image = "${local.image_name}:${local.tag}"
 }
 
 resource "null_resource" "build_and_push" {
-  # Rebuild when the Dockerfile changes
+  # Rebuild when any image input changes. `source_hash` already covers
+  # the Dockerfile and `tag` derives from it, so one key is enough.
   triggers = {
-    dockerfile_hash = filesha256("${path.root}/../../Dockerfile")
-    repo_hash       = local.repo_hash
-    tag             = local.tag
+    inputs_hash = local.source_hash
   }
 
   provisioner "local-exec" {
     command = <<-EOT
-      gcloud builds submit "../../" \
+      gcloud builds submit "${local.repo_root}" \
         --project ${var.project_id} \
         --region ${var.region} \
-        --tag ${local.full_image}
+        --config ${path.module}/cloudbuild.yaml \
+        --substitutions _IMAGE=${local.image_name},_TAG=${local.tag}
     EOT
   }
 
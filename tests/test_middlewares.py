@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from fastmcp.server.middleware import MiddlewareContext
+
+from emsipi.middlewares import ASGIMiddleware, SimpleLoggingMiddleware
+
+if TYPE_CHECKING:
+    from fastmcp import Context
+    from starlette.types import Message, Receive, Scope, Send
+
+LOGGER_NAME = "emsipi.middlewares"
+
+
+class StubRequest:
+    """Stand-in for the Starlette request behind a FastMCP context."""
+
+    def __init__(self) -> None:
+        self.json_calls = 0
+        self.headers = {"content-type": "application/json"}
+        self.query_params: dict[str, str] = {}
+        self.path_params: dict[str, str] = {}
+
+    async def json(self) -> dict[str, str]:
+        self.json_calls += 1
+        return {"method": "tools/call"}
+
+
+def make_context(request: StubRequest) -> MiddlewareContext[dict[str, str]]:
+    fastmcp_context = SimpleNamespace(
+        request_context=SimpleNamespace(request=request)
+    )
+    return MiddlewareContext(
+        message={},
+        fastmcp_context=cast("Context", fastmcp_context),
+    )
+
+
+async def call_next(context: MiddlewareContext[dict[str, str]]) -> object:
+    return context.message
+
+
+def test_simple_logging_middleware_logs_request(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.INFO, logger=LOGGER_NAME)
+    request = StubRequest()
+
+    result = asyncio.run(
+        SimpleLoggingMiddleware()(make_context(request), call_next)
+    )
+
+    assert result == {}
+    assert request.json_calls == 1
+    assert "tools/call" in caplog.text
+
+
+def test_simple_logging_middleware_skips_body_when_disabled(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.WARNING, logger=LOGGER_NAME)
+    request = StubRequest()
+
+    result = asyncio.run(
+        SimpleLoggingMiddleware()(make_context(request), call_next)
+    )
+
+    assert result == {}
+    assert request.json_calls == 0
+    assert not caplog.records
+
+
+def run_asgi(scope: "Scope") -> "Scope":
+    seen: dict[str, Scope] = {}
+
+    async def app(inner: "Scope", receive: "Receive", send: "Send") -> None:
+        seen["scope"] = inner
+        await receive()
+        await send({"type": "http.response.start", "status": 200})
+
+    async def receive() -> "Message":
+        return {"type": "http.request", "body": b"{}"}
+
+    async def send(_message: "Message") -> None:
+        return None
+
+    asyncio.run(ASGIMiddleware(app)(scope, receive, send))
+    return seen["scope"]
+
+
+def test_asgi_middleware_logs_request(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, logger=LOGGER_NAME)
+
+    scope = run_asgi({"type": "http", "path": "/mcp", "raw_path": b"/mcp"})
+
+    assert scope["path"] == "/mcp/"
+    assert scope["raw_path"] == b"/mcp/"
+    assert '"path": "/mcp"' in caplog.text
+    assert "http.response.start" in caplog.text
+
+
+def test_asgi_middleware_skips_logging_when_disabled(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.WARNING, logger=LOGGER_NAME)
+
+    scope = run_asgi({"type": "http", "path": "/mcp", "raw_path": b"/mcp"})
+
+    assert scope["path"] == "/mcp/"
+    assert scope["raw_path"] == b"/mcp/"
+    assert not caplog.records
+
+
+def test_asgi_middleware_passes_non_http_scopes_through(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.INFO, logger=LOGGER_NAME)
+    scope: Scope = {"type": "lifespan", "path": "/mcp"}
+    calls: list[tuple[Scope, Receive, Send]] = []
+
+    async def app(inner: "Scope", receive: "Receive", send: "Send") -> None:
+        calls.append((inner, receive, send))
+
+    async def receive() -> "Message":
+        return {"type": "lifespan.startup"}
+
+    async def send(_message: "Message") -> None:
+        return None
+
+    asyncio.run(ASGIMiddleware(app)(scope, receive, send))
+
+    assert calls == [(scope, receive, send)]
+    assert scope["path"] == "/mcp"
+    assert not caplog.records